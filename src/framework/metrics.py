@@ -1,5 +1,7 @@
 # metrics.py
 
+import numpy as np
+
 def calculate_ctr(impressions, clicks):
     """
     Calculate Click-Through Rate
@@ -40,4 +42,103 @@ def calculate_time_spent(session_durations):
     Returns:
         Average session duration in seconds
     """
-    return sum(session_durations) / len(session_durations) if session_durations else 0
\ No newline at end of file
+    arr = np.asarray(session_durations, dtype=np.float64)
+    return float(arr.mean()) if arr.size else 0.0
+
+def calculate_ctr_batch(impressions, clicks):
+    """
+    Calculate Click-Through Rate for many recommendation sets at once
+    
+    CTR = Number of Clicks / Number of Impressions, element-wise
+    
+    Args:
+        impressions: Array of impression counts
+        clicks: Array of click counts, same shape as impressions
+        
+    Returns:
+        Float array of click-through rates, 0 where there were no impressions
+    """
+    impressions = np.asarray(impressions, dtype=np.float64)
+    clicks = np.asarray(clicks, dtype=np.float64)
+    return np.divide(clicks, impressions, out=np.zeros_like(clicks), where=impressions > 0)
+
+def calculate_application_rate_batch(clicks, applications):
+    """
+    Calculate Application Rate for many recommendation sets at once
+    
+    Application Rate = Number of Applications / Number of Clicks, element-wise
+    
+    Args:
+        clicks: Array of click counts
+        applications: Array of application counts, same shape as clicks
+        
+    Returns:
+        Float array of application rates, 0 where there were no clicks
+    """
+    clicks = np.asarray(clicks, dtype=np.float64)
+    applications = np.asarray(applications, dtype=np.float64)
+    return np.divide(applications, clicks, out=np.zeros_like(applications), where=clicks > 0)
+
+class MetricsAggregator:
+    """
+    Accumulate CTR, application rate and average time spent in a single pass
+    
+    Instead of calling calculate_ctr, calculate_application_rate and
+    calculate_time_spent over the same session log, feed each session (or a
+    batch of sessions) to update/update_batch and read all three from finalize.
+    """
+    
+    __slots__ = ("imp", "clk", "app", "dur_sum", "dur_n")
+    
+    def __init__(self):
+        self.imp = 0
+        self.clk = 0
+        self.app = 0
+        self.dur_sum = 0.0
+        self.dur_n = 0
+    
+    def update(self, impressions, clicks, applications, duration):
+        """
+        Add one session to the running totals
+        
+        Args:
+            impressions: Number of recommendation impressions in the session
+            clicks: Number of clicks on recommendations in the session
+            applications: Number of job applications submitted in the session
+            duration: Session duration in seconds
+        """
+        self.imp += impressions
+        self.clk += clicks
+        self.app += applications
+        self.dur_sum += duration
+        self.dur_n += 1
+    
+    def update_batch(self, impressions, clicks, applications, durations):
+        """
+        Add many sessions to the running totals with one reduction per field
+        
+        Args:
+            impressions: Array of impression counts per session
+            clicks: Array of click counts per session
+            applications: Array of application counts per session
+            durations: Array of session durations in seconds
+        """
+        durations = np.asarray(durations, dtype=np.float64)
+        self.imp += np.asarray(impressions).sum().item()
+        self.clk += np.asarray(clicks).sum().item()
+        self.app += np.asarray(applications).sum().item()
+        self.dur_sum += durations.sum().item()
+        self.dur_n += durations.size
+    
+    def finalize(self):
+        """
+        Compute the aggregated metrics
+        
+        Returns:
+            Dict with "ctr", "app_rate" and "avg_time"
+        """
+        return {
+            "ctr": calculate_ctr(self.imp, self.clk),
+            "app_rate": calculate_application_rate(self.clk, self.app),
+            "avg_time": self.dur_sum / self.dur_n if self.dur_n > 0 else 0.0
+        }
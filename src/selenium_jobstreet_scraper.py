@@ -1,10 +1,26 @@
 import time
 import random
+import asyncio
+import itertools
+import json
 import pandas as pd
 import csv
 from datetime import datetime
 import os
 import re
+import shutil
+import sys
+import tempfile
+import multiprocessing
+from contextlib import contextmanager
+from functools import lru_cache, partial
+import aiohttp
+import httpx
+import lxml.html
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -14,8 +30,216 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 from webdriver_manager.chrome import ChromeDriverManager
 
+# User agents to rotate
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36"
+]
+
+INDUSTRIES = ["Finance", "IT", "Healthcare", "Education", "Manufacturing", "Sales", "Marketing", "Engineering", "Admin", "Hospitality"]
+COMMON_SKILLS = ["python", "java", "sql", "excel", "communication", "leadership", "teamwork", "project management", "analysis", "problem solving"]
+
+# Acronyms matched with their exact casing; "it" is far more often the pronoun than the industry
+CASE_SENSITIVE_INDUSTRIES = {"IT"}
+
+def _alternation(words):
+    """Join keywords into an escaped regex alternation."""
+    return "|".join(re.escape(word) for word in words)
+
+def _keyword_regex(words):
+    """Compile a case-insensitive, whole-word alternation of the given keywords."""
+    return re.compile(r"\b(" + _alternation(words) + r")\b", re.I)
+
+# Compiled once so every card is classified with a single C-level scan of its text
+_INDUSTRY_RE = re.compile(
+    r"\b((?i:" + _alternation(c for c in INDUSTRIES if c not in CASE_SENSITIVE_INDUSTRIES) + r")|"
+    + _alternation(CASE_SENSITIVE_INDUSTRIES) + r")\b"
+)
+_SKILL_RE = _keyword_regex(COMMON_SKILLS)
+_INDUSTRY_BY_KEYWORD = {category.lower(): category for category in INDUSTRIES}
+
+def _infer_industry(job_title, description):
+    """Guess the industry from the job title or description, by INDUSTRIES priority."""
+    found = {_INDUSTRY_BY_KEYWORD[keyword.lower()] for keyword in _INDUSTRY_RE.findall(f"{job_title} {description}")}
+    for category in INDUSTRIES:
+        if category in found:
+            return category
+    return "Not specified"
+
+def _match_skills(description):
+    """Return the common skills mentioned in a job description."""
+    found = {skill.lower() for skill in _SKILL_RE.findall(description)}
+    return [skill for skill in COMMON_SKILLS if skill in found]
+
+JOB_CARD_SELECTOR = "article, [data-automation='jobListing'], .sx2jih0"
+
+# Selectors for each job card field, tried in order until one matches
+CARD_FIELD_SELECTORS = {
+    'job_title': ["h1.sx2jih0, .job-title, [data-automation='job-title']", "a h1, a[data-automation='jobTitle']"],
+    'company': [".sx2jih0 span, [data-automation='jobCompany'], .company-name"],
+    'location': ["[data-automation='jobLocation'], .location"],
+    'description': [".job-description, [data-automation='jobShortDescription'], .sx2jih0 > div:nth-child(2)"],
+    'salary': ["[data-automation='jobSalary'], .salary"],
+    'job_type': ["[data-automation='jobType'], .job-type"],
+    'posting_date': ["[data-automation='jobListingDate'], .listing-date, .sx2jih0 > span:last-child"],
+    'industry': ["[data-automation='jobIndustry'], .job-category"]
+}
+
+def _job_cards(tree):
+    """Return the job card nodes of a selectolax tree, each once and in document order."""
+    # lexbor returns a node once per part of the selector list it matches
+    return list({card.mem_id: card for card in tree.css(JOB_CARD_SELECTOR)}.values())
+
+def _extract_card_fields(card, page_url):
+    """Read a job card parsed by selectolax into the same row shape JS_EXTRACT returns."""
+    row = {}
+    for field, selectors in CARD_FIELD_SELECTORS.items():
+        row[field] = None
+        for selector in selectors:
+            node = card.css_first(selector)
+            if node is not None:
+                # strip=True only trims each text node; empty nodes still add separators
+                row[field] = node.text(separator=" ", strip=True).strip()
+                break
+    link = card.css_first("a")
+    href = link.attributes.get("href") if link is not None else None
+    row['job_url'] = urljoin(page_url, href) if href else None
+    return row
+
+# Selectors for the job details page
+DETAIL_DESCRIPTION_SELECTOR = ".job-description, [data-automation='jobDetailsDescription']"
+DETAIL_SKILLS_SELECTOR = ".skill-tag, [data-automation='skills'] span"
+DETAIL_LABEL_XPATHS = {
+    key: f"//label[contains(text(), '{label}')]/following-sibling::*"
+    for key, label in [('experience_level', 'Career Level'),
+                       ('qualification', 'Qualification'),
+                       ('years_of_experience', 'Years of Experience')]
+}
+
+def _parse_job_details(html):
+    """Extract the full description and labelled details from a job page's HTML."""
+    tree = lxml.html.fromstring(html)
+    
+    # Extract full job description
+    description_elements = tree.cssselect(DETAIL_DESCRIPTION_SELECTOR)
+    if description_elements:
+        full_description = description_elements[0].text_content().strip()
+    else:
+        full_description = "Failed to retrieve full description"
+    
+    # Extract additional details specific to JobStreet
+    job_details = {}
+    
+    for key, xpath in DETAIL_LABEL_XPATHS.items():
+        elements = tree.xpath(xpath)
+        job_details[key] = elements[0].text_content().strip() if elements else "Not specified"
+    
+    # Required skills
+    skills_elements = tree.cssselect(DETAIL_SKILLS_SELECTOR)
+    job_details['required_skills'] = ", ".join(element.text_content().strip() for element in skills_elements)
+    
+    return {'full_description': full_description, **job_details}
+
+# Walks every job card in the browser and returns plain objects in a single call
+JS_EXTRACT = """
+const [cardSelector, fieldSelectors] = arguments;
+return Array.from(document.querySelectorAll(cardSelector)).map(card => {
+    const row = {};
+    for (const [field, selectors] of Object.entries(fieldSelectors)) {
+        row[field] = null;
+        for (const selector of selectors) {
+            const el = card.querySelector(selector);
+            if (el) {
+                row[field] = el.innerText.trim();
+                break;
+            }
+        }
+    }
+    const link = card.querySelector("a");
+    row.job_url = link ? link.href : null;
+    return row;
+});
+"""
+
+# ChromeDriver path handed to pool workers by _init_worker
+_chromedriver_path = None
+
+@lru_cache(maxsize=1)
+def _get_chromedriver_path():
+    """
+    Resolve the ChromeDriver binary once per process.
+    
+    Set CHROMEDRIVER_PATH to use a pinned local driver and skip webdriver_manager's
+    network version check entirely.
+    """
+    return os.environ.get("CHROMEDRIVER_PATH") or _chromedriver_path or ChromeDriverManager().install()
+
+def _init_worker(chromedriver_path):
+    """Pool initializer: reuse the ChromeDriver path the parent already resolved."""
+    global _chromedriver_path
+    _chromedriver_path = chromedriver_path
+
+# CSV columns, in the order _extract_job_data builds them
+FIELDS = [
+    'job_id', 'job_title', 'company', 'location', 'description', 'salary', 'job_type',
+    'posting_date', 'job_url', 'industry', 'skills', 'scraped_date', 'search_query'
+]
+
+# Extra CSV columns filled in when job details are scraped
+DETAIL_FIELDS = ['full_description', 'experience_level', 'qualification', 'years_of_experience', 'required_skills']
+
+def _timestamped_filename(filename):
+    """Add the current timestamp to a filename, before its extension."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{os.path.splitext(filename)[0]}_{timestamp}{os.path.splitext(filename)[1]}"
+
+# Resources the scraper never reads; blocking them keeps listing pages small
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.woff*", "*.css",
+    "*google-analytics*", "*doubleclick*", "*gstatic*"
+]
+
+# Prefix for made-up IDs of jobs whose URL has no JobStreet ID; these are never deduplicated
+FALLBACK_ID_PREFIX = "job_"
+
+def _unique_jobs(jobs):
+    """Drop later copies of a job ID so its detail page is fetched once; fallback IDs are all kept."""
+    ids = set()
+    unique = []
+    for job_data in jobs:
+        job_id = job_data['job_id']
+        if not job_id.startswith(FALLBACK_ID_PREFIX):
+            if job_id in ids:
+                continue
+            ids.add(job_id)
+        unique.append(job_data)
+    return unique
+
 class JobStreetScraper:
-    def __init__(self, location="Malaysia", num_pages=5, headless=False):
+    _JOB_ID_RE = re.compile(r'/(\d+)(?:\?|$)')
+    
+    # Multiple possible selectors for the cookie button, joined into one XPath
+    # union so a single wait covers them all instead of one timeout per candidate
+    _COOKIE_XPATH = " | ".join([
+        "//button[contains(text(), 'Accept')]",
+        "//button[contains(text(), 'I agree')]",
+        "//button[contains(text(), 'Accept all')]",
+        "//button[contains(@id, 'cookie')]",
+        "//button[contains(@class, 'cookie')]"
+    ])
+    
+    # Common popup close buttons
+    _POPUP_XPATH = " | ".join([
+        "//button[contains(@aria-label, 'Close')]",
+        "//button[contains(@class, 'close')]",
+        "//div[contains(@class, 'close')]",
+        "//span[contains(@class, 'close')]",
+        "//button[contains(text(), 'No thanks')]"
+    ])
+    
+    def __init__(self, location="Malaysia", num_pages=5, headless=False, output_file=None, scrape_details=False):
         """
         Initialize the JobStreet Malaysia scraper.
         
@@ -23,46 +247,110 @@ class JobStreetScraper:
             location (str): The location to search for jobs (default: Malaysia)
             num_pages (int): Number of pages to scrape per query
             headless (bool): Whether to run Chrome in headless mode
+            output_file (str): CSV file to stream jobs to as they are scraped. A timestamp
+                is added to the name. If None, jobs are kept in self.jobs instead.
+            scrape_details (bool): Whether to also fetch each job's detail page
         """
         self.base_url = "https://www.jobstreet.com.my"
         self.location = location
         self.num_pages = num_pages
+        self.headless = headless
+        self.scrape_details = scrape_details
         self.jobs = []
+        self.jobs_scraped = 0
+        
+        # Job IDs already scraped; overlapping queries return many of the same jobs
+        self._seen_ids = set()
+        
+        # Write rows as they arrive so memory stays flat and a crash keeps what was scraped
+        self.output_file = None
+        self._csv_fh = None
+        self._writer = None
+        if output_file:
+            self.output_file = _timestamped_filename(output_file)
+            self._csv_fh = open(self.output_file, "w", newline="", encoding="utf-8")
+            fieldnames = FIELDS + DETAIL_FIELDS if scrape_details else FIELDS
+            self._writer = csv.DictWriter(self._csv_fh, fieldnames=fieldnames, quoting=csv.QUOTE_ALL, extrasaction="ignore")
+            self._writer.writeheader()
+        
+        # Per-instance RNG avoids contending on the shared module-level generator
+        self._rng = random.Random()
+        
+        # User agents to rotate, shuffled once and then cycled through
+        self.user_agents = list(USER_AGENTS)
+        self._ua_cycle = itertools.cycle(self._rng.sample(self.user_agents, k=len(self.user_agents)))
+        
+        # The driver is started lazily so worker processes each own their browser
+        self.driver = None
+        self._profile_dir = None
         
-        # User agents to rotate
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36"
-        ]
+        # Event loop and aiohttp session for detail pages, opened once per scrape run
+        self._detail_loop = None
+        self._detail_session = None
         
-        # Initialize the driver
-        self.driver = self._setup_driver(headless)
+        # Keep-alive session for listing and job detail pages, which are server-rendered
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=3))
+        self.http.headers.update({
+            "User-Agent": next(self._ua_cycle),
+            "Accept-Language": "en-US,en;q=0.9"
+        })
     
     def _setup_driver(self, headless):
         """Set up the Chrome WebDriver with appropriate options."""
         options = Options()
         if headless:
             options.add_argument("--headless")
+            # One renderer is enough for a single scraping tab and caps memory per worker
+            options.add_argument("--renderer-process-limit=1")
         
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--disable-notifications")
         options.add_argument("--disable-popup-blocking")
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-blink-features=AutomationControlled")
+        
+        # Lean renderer settings for short-lived scraping browsers
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-sync")
+        options.add_argument("--disable-translate")
+        options.add_argument("--mute-audio")
+        options.add_argument("--no-first-run")
+        
+        # Keep the throwaway profile in RAM on Linux to avoid disk I/O on every start
+        if sys.platform.startswith("linux") and os.path.isdir("/dev/shm"):
+            self._profile_dir = tempfile.mkdtemp(prefix="jobstreet-chrome-", dir="/dev/shm")
+            options.add_argument(f"--user-data-dir={self._profile_dir}")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
         
-        # Install and setup ChromeDriver
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        # Setup ChromeDriver; a failed start must not leave the profile behind in RAM
+        try:
+            service = Service(_get_chromedriver_path())
+            driver = webdriver.Chrome(service=service, options=options)
+        except Exception:
+            if self._profile_dir is not None:
+                shutil.rmtree(self._profile_dir, ignore_errors=True)
+                self._profile_dir = None
+            raise
         
         # Set the user agent
         driver.execute_cdp_cmd("Network.setUserAgentOverride", {
-            "userAgent": random.choice(self.user_agents)
+            "userAgent": next(self._ua_cycle)
         })
         
+        # Block images, fonts, stylesheets and trackers; HTML and JS still load
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        
         # Add necessary cookies
         driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
             "source": """
@@ -74,32 +362,99 @@ class JobStreetScraper:
         
         return driver
     
+    def _start_driver(self):
+        """Start the Chrome WebDriver if it is not already running."""
+        if getattr(self, 'driver', None) is None:
+            self.driver = self._setup_driver(self.headless)
+        return self.driver
+    
+    def _quit_driver(self):
+        """Quit the Chrome WebDriver if it is running."""
+        if getattr(self, 'driver', None) is not None:
+            self.driver.quit()
+            self.driver = None
+        
+        if getattr(self, '_profile_dir', None) is not None:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
+    
     def __del__(self):
-        """Close the driver when the object is deleted."""
+        """Close the driver and the CSV file when the object is deleted."""
         try:
-            if hasattr(self, 'driver'):
-                self.driver.quit()
+            self._quit_driver()
         except:
             pass
+        
+        try:
+            if getattr(self, '_csv_fh', None) is not None:
+                self._csv_fh.close()
+        except:
+            pass
+    
+    def _record_job(self, job_data):
+        """
+        Write a scraped job to the CSV stream, or keep it in memory if not streaming.
+        
+        Jobs whose ID was already recorded are skipped. IDs are only marked as
+        seen here, so a page that fails before its rows are recorded can be
+        picked up again later.
+        """
+        if not self._is_new_job(job_data['job_id']):
+            return
+        
+        if self._writer is not None:
+            self._writer.writerow(job_data)
+        else:
+            self.jobs.append(job_data)
+        
+        self.jobs_scraped += 1
+        
+        # Print progress
+        if self.jobs_scraped % 10 == 0:
+            print(f"Scraped {self.jobs_scraped} jobs so far")
+    
+    def _is_new_job(self, job_id):
+        """
+        Mark a job ID as seen. Returns True the first time, False for repeats.
+        
+        Fallback IDs are random and may collide between scrapers, so they are
+        always treated as new.
+        """
+        if job_id.startswith(FALLBACK_ID_PREFIX):
+            return True
+        if job_id in self._seen_ids:
+            return False
+        self._seen_ids.add(job_id)
+        return True
+    
+    def _flush_csv(self):
+        """Push streamed rows to disk so they survive a crash."""
+        if self._csv_fh is not None:
+            self._csv_fh.flush()
     
     def _human_like_delay(self, min_seconds=2, max_seconds=5):
         """Add a random delay to simulate human behavior."""
-        delay = random.uniform(min_seconds, max_seconds)
+        delay = self._rng.uniform(min_seconds, max_seconds)
         time.sleep(delay)
     
-    def _human_like_scroll(self):
-        """Scroll the page like a human would."""
-        total_height = int(self.driver.execute_script("return document.body.scrollHeight"))
-        viewport_height = int(self.driver.execute_script("return window.innerHeight"))
+    def _human_like_scroll(self, wait_selector=None, timeout=10):
+        """
+        Jump to the bottom of the page to trigger lazy loading.
         
-        for i in range(0, total_height, viewport_height // 3):
-            self.driver.execute_script(f"window.scrollTo(0, {i});")
-            self._human_like_delay(0.1, 0.3)
+        Args:
+            wait_selector (str): CSS selector that appears once lazy content has loaded
+            timeout (int): Maximum number of seconds to wait for wait_selector
+        """
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         
-        # Scroll back up randomly
-        if random.random() < 0.3:
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            self._human_like_delay(0.5, 1)
+        if wait_selector:
+            try:
+                WebDriverWait(self.driver, timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+                )
+            except TimeoutException:
+                # Short result lists have no pagination, so carry on with what loaded
+                pass
     
     def _build_search_url(self, query="", page=1):
         """Build the URL for JobStreet search."""
@@ -112,26 +467,13 @@ class JobStreetScraper:
     def _accept_cookies_if_present(self):
         """Accept cookies dialog if it appears."""
         try:
-            # Multiple possible selectors for the cookie button
-            cookie_buttons = [
-                "//button[contains(text(), 'Accept')]",
-                "//button[contains(text(), 'I agree')]",
-                "//button[contains(text(), 'Accept all')]",
-                "//button[contains(@id, 'cookie')]",
-                "//button[contains(@class, 'cookie')]"
-            ]
-            
-            for button_xpath in cookie_buttons:
-                try:
-                    cookie_button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, button_xpath))
-                    )
-                    cookie_button.click()
-                    self._human_like_delay(1, 2)
-                    return True
-                except (TimeoutException, NoSuchElementException):
-                    continue
-            
+            cookie_button = WebDriverWait(self.driver, 3).until(
+                EC.element_to_be_clickable((By.XPATH, self._COOKIE_XPATH))
+            )
+            cookie_button.click()
+            self._human_like_delay(1, 2)
+            return True
+        except (TimeoutException, NoSuchElementException):
             return False
         except Exception as e:
             print(f"Error handling cookies: {e}")
@@ -140,195 +482,207 @@ class JobStreetScraper:
     def _close_popups(self):
         """Close any popups that might appear."""
         try:
-            # Look for common popup close buttons
-            close_buttons = [
-                "//button[contains(@aria-label, 'Close')]",
-                "//button[contains(@class, 'close')]",
-                "//div[contains(@class, 'close')]",
-                "//span[contains(@class, 'close')]",
-                "//button[contains(text(), 'No thanks')]"
-            ]
-            
-            for button_xpath in close_buttons:
-                try:
-                    close_button = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, button_xpath))
-                    )
-                    close_button.click()
-                    self._human_like_delay(1, 2)
-                    return True
-                except (TimeoutException, NoSuchElementException, ElementClickInterceptedException):
-                    continue
-            
+            close_button = WebDriverWait(self.driver, 3).until(
+                EC.element_to_be_clickable((By.XPATH, self._POPUP_XPATH))
+            )
+            close_button.click()
+            self._human_like_delay(1, 2)
+            return True
+        except (TimeoutException, NoSuchElementException, ElementClickInterceptedException):
             return False
         except Exception as e:
             print(f"Error handling popups: {e}")
             return False
     
-    def _extract_job_data(self, job_card):
-        """Extract job information from a job card element."""
+    def _extract_job_data(self, row):
+        """
+        Build a job record from the raw card fields returned by JS_EXTRACT.
+        
+        Args:
+            row (dict): Field texts for one job card, None where no selector matched
+        """
+        def text_or_na(field):
+            return row.get(field) or "N/A"
+        
+        job_title = text_or_na('job_title')
+        description = text_or_na('description')
+        
+        # Extract job ID from URL if possible
+        job_url = text_or_na('job_url')
+        job_id_match = self._JOB_ID_RE.search(job_url)
+        if job_id_match:
+            job_id = job_id_match.group(1)
+            # Skip jobs already recorded under another query or page
+            if job_id in self._seen_ids:
+                return None
+        else:
+            job_id = f"{FALLBACK_ID_PREFIX}{self._rng.randint(10000, 99999)}"
+        
+        # JobStreet often has category info; if not, try to extract from title or description
+        industry = row.get('industry') or _infer_industry(job_title, description)
+        
+        # Try to extract skills from description
+        skills = _match_skills(description)
+        
+        return {
+            'job_id': job_id,
+            'job_title': job_title,
+            'company': text_or_na('company'),
+            'location': text_or_na('location'),
+            'description': description,
+            'salary': text_or_na('salary'),
+            'job_type': text_or_na('job_type'),
+            'posting_date': text_or_na('posting_date'),
+            'job_url': job_url,
+            'industry': industry,
+            'skills': ", ".join(skills) if skills else "Not specified",
+            'scraped_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    
+    def scrape_job_details(self, job_url):
+        """
+        Fetch the job page over HTTP and scrape detailed information.
+        
+        Falls back to the browser if JobStreet blocks the request (403) or
+        returns a server error.
+        """
         try:
-            # JobStreet has different HTML structure than Indeed
-            
-            # Extract job title
-            try:
-                title_element = job_card.find_element(By.CSS_SELECTOR, "h1.sx2jih0, .job-title, [data-automation='job-title']")
-                job_title = title_element.text.strip()
-            except NoSuchElementException:
-                try:
-                    title_element = job_card.find_element(By.CSS_SELECTOR, "a h1, a[data-automation='jobTitle']")
-                    job_title = title_element.text.strip()
-                except NoSuchElementException:
-                    job_title = "N/A"
-            
-            # Extract job URL
-            try:
-                job_link = job_card.find_element(By.TAG_NAME, "a")
-                job_url = job_link.get_attribute("href")
-                # Extract job ID from URL if possible
-                job_id_match = re.search(r'/(\d+)(?:\?|$)', job_url)
-                job_id = job_id_match.group(1) if job_id_match else f"job_{random.randint(10000, 99999)}"
-            except (NoSuchElementException, AttributeError):
-                job_url = "N/A"
-                job_id = f"job_{random.randint(10000, 99999)}"
-            
-            # Extract company name
-            try:
-                company_element = job_card.find_element(By.CSS_SELECTOR, ".sx2jih0 span, [data-automation='jobCompany'], .company-name")
-                company = company_element.text.strip()
-            except NoSuchElementException:
-                company = "N/A"
-            
-            # Extract job location
-            try:
-                location_element = job_card.find_element(By.CSS_SELECTOR, "[data-automation='jobLocation'], .location")
-                location = location_element.text.strip()
-            except NoSuchElementException:
-                location = "N/A"
-            
-            # Extract job description snippet
-            try:
-                description_element = job_card.find_element(By.CSS_SELECTOR, ".job-description, [data-automation='jobShortDescription'], .sx2jih0 > div:nth-child(2)")
-                description = description_element.text.strip()
-            except NoSuchElementException:
-                description = "N/A"
-            
-            # Extract salary if available
-            try:
-                salary_element = job_card.find_element(By.CSS_SELECTOR, "[data-automation='jobSalary'], .salary")
-                salary = salary_element.text.strip()
-            except NoSuchElementException:
-                salary = "N/A"
-            
-            # Extract job type if available
-            try:
-                job_type_element = job_card.find_element(By.CSS_SELECTOR, "[data-automation='jobType'], .job-type")
-                job_type = job_type_element.text.strip()
-            except NoSuchElementException:
-                job_type = "N/A"
-            
-            # Extract posting date
-            try:
-                date_element = job_card.find_element(By.CSS_SELECTOR, "[data-automation='jobListingDate'], .listing-date, .sx2jih0 > span:last-child")
-                posting_date = date_element.text.strip()
-            except NoSuchElementException:
-                posting_date = "N/A"
-            
-            # Try to extract industry/category
-            industry = "Not specified"
-            # JobStreet often has category info
-            try:
-                industry_element = job_card.find_element(By.CSS_SELECTOR, "[data-automation='jobIndustry'], .job-category")
-                industry = industry_element.text.strip()
-            except NoSuchElementException:
-                # If no specific element, try to extract from title or description
-                for category in ["Finance", "IT", "Healthcare", "Education", "Manufacturing", "Sales", "Marketing", "Engineering", "Admin", "Hospitality"]:
-                    if category.lower() in job_title.lower() or category.lower() in description.lower():
-                        industry = category
-                        break
-            
-            # Try to extract skills from description
-            skills = []
-            common_skills = ["python", "java", "sql", "excel", "communication", "leadership", "teamwork", "project management", "analysis", "problem solving"]
-            for skill in common_skills:
-                if skill.lower() in description.lower():
-                    skills.append(skill)
-            
-            return {
-                'job_id': job_id,
-                'job_title': job_title,
-                'company': company,
-                'location': location,
-                'description': description,
-                'salary': salary,
-                'job_type': job_type,
-                'posting_date': posting_date,
-                'job_url': job_url,
-                'industry': industry,
-                'skills': ", ".join(skills) if skills else "Not specified",
-                'scraped_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
+            resp = self.http.get(job_url, headers={"User-Agent": next(self._ua_cycle)}, timeout=15)
+        except requests.RequestException as e:
+            print(f"Error scraping job details: {e}")
+            return {'full_description': "Failed to retrieve full description"}
+        
+        if resp.status_code == 403 or resp.status_code >= 500:
+            return self._scrape_job_details_with_browser(job_url)
+        
+        if resp.status_code != 200:
+            print(f"Error scraping job details: HTTP {resp.status_code} for {job_url}")
+            return {'full_description': "Failed to retrieve full description"}
+        
+        try:
+            return _parse_job_details(resp.text)
         except Exception as e:
-            print(f"Error extracting job data: {e}")
-            return None
+            print(f"Error scraping job details: {e}")
+            return {'full_description': "Failed to retrieve full description"}
     
-    def scrape_job_details(self, job_url):
-        """Visit the job page and scrape detailed information."""
+    async def _fetch_detail(self, session, url):
+        """
+        Fetch and parse one job page with aiohttp.
+        
+        Returns:
+            dict: Job details, or None if the page needs the browser (403 or 5xx)
+        """
+        try:
+            # The session's headers are copied once; send the current rotated user agent
+            async with session.get(url, headers={"User-Agent": self.http.headers["User-Agent"]}) as resp:
+                if resp.status == 403 or resp.status >= 500:
+                    return None
+                if resp.status != 200:
+                    print(f"Error scraping job details: HTTP {resp.status} for {url}")
+                    return {'full_description': "Failed to retrieve full description"}
+                html = await resp.text()
+            return _parse_job_details(html)
+        except Exception as e:
+            print(f"Error scraping job details: {e}")
+            return {'full_description': "Failed to retrieve full description"}
+    
+    async def _open_detail_session(self):
+        """Create the aiohttp session used for detail pages; must run inside the event loop."""
+        return aiohttp.ClientSession(
+            headers=dict(self.http.headers),
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+    
+    @contextmanager
+    def _detail_fetcher(self):
+        """
+        Keep one event loop and aiohttp session open for a whole scrape run, so
+        the keep-alive pool and DNS cache are shared by every listing page.
+        """
+        if not self.scrape_details or self._detail_loop is not None:
+            yield
+            return
+        
+        self._detail_loop = asyncio.new_event_loop()
+        self._detail_session = self._detail_loop.run_until_complete(self._open_detail_session())
         try:
+            yield
+        finally:
+            self._detail_loop.run_until_complete(self._detail_session.close())
+            self._detail_loop.close()
+            self._detail_loop = None
+            self._detail_session = None
+    
+    async def _fetch_details(self, urls):
+        """Fetch many job pages concurrently; results are in the same order as urls."""
+        semaphore = asyncio.Semaphore(16)
+        
+        async def bounded(url):
+            async with semaphore:
+                return await self._fetch_detail(self._detail_session, url)
+        
+        return await asyncio.gather(*[bounded(url) for url in urls], return_exceptions=True)
+    
+    async def _add_job_details_async(self, jobs):
+        """Fetch detail pages for jobs concurrently and merge the results into each job."""
+        jobs = [job_data for job_data in jobs if job_data['job_url'] != "N/A"]
+        if not jobs:
+            return
+        
+        details = await self._fetch_details([job_data['job_url'] for job_data in jobs])
+        for job_data, job_details in zip(jobs, details):
+            if isinstance(job_details, BaseException):
+                print(f"Error scraping job details: {job_details}")
+                job_details = {'full_description': "Failed to retrieve full description"}
+            elif job_details is None:
+                # Blocked pages go through the browser, off the event loop
+                job_details = await asyncio.to_thread(self._scrape_job_details_with_browser, job_data['job_url'])
+            job_data.update(job_details)
+    
+    def _add_job_details(self, jobs):
+        """Fetch detail pages for jobs concurrently and merge the results into each job."""
+        if self._detail_loop is None:
+            with self._detail_fetcher():
+                return self._add_job_details(jobs)
+        
+        self._detail_loop.run_until_complete(self._add_job_details_async(jobs))
+    
+    def _scrape_job_details_with_browser(self, job_url):
+        """Visit the job page in a new browser tab and scrape detailed information."""
+        try:
+            self._start_driver()
+            
             # Open the job page in a new tab
             self.driver.execute_script(f"window.open('{job_url}', '_blank');")
-            self._human_like_delay(1, 2)
+            WebDriverWait(self.driver, 10).until(EC.number_of_windows_to_be(2))
             
             # Switch to the new tab
             self.driver.switch_to.window(self.driver.window_handles[1])
-            self._human_like_delay(3, 5)
             
-            # Wait for the page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".job-description, [data-automation='jobDetailsDescription']"))
+            # Wait for the page to load; the wait hands back the description element
+            job_description_element = WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_DESCRIPTION_SELECTOR))
             )
             
             # Scroll like a human
             self._human_like_scroll()
             
             # Extract full job description
-            try:
-                job_description_element = self.driver.find_element(By.CSS_SELECTOR, ".job-description, [data-automation='jobDetailsDescription']")
-                full_description = job_description_element.text.strip()
-            except NoSuchElementException:
-                full_description = "Failed to retrieve full description"
+            full_description = job_description_element.text.strip()
             
             # Extract additional details specific to JobStreet
             job_details = {}
             
-            # Career level / Experience level
-            try:
-                career_level_element = self.driver.find_element(By.XPATH, "//label[contains(text(), 'Career Level')]/following-sibling::*")
-                job_details['experience_level'] = career_level_element.text.strip()
-            except NoSuchElementException:
-                job_details['experience_level'] = "Not specified"
-            
-            # Qualification
-            try:
-                qualification_element = self.driver.find_element(By.XPATH, "//label[contains(text(), 'Qualification')]/following-sibling::*")
-                job_details['qualification'] = qualification_element.text.strip()
-            except NoSuchElementException:
-                job_details['qualification'] = "Not specified"
-            
-            # Years of experience
-            try:
-                years_exp_element = self.driver.find_element(By.XPATH, "//label[contains(text(), 'Years of Experience')]/following-sibling::*")
-                job_details['years_of_experience'] = years_exp_element.text.strip()
-            except NoSuchElementException:
-                job_details['years_of_experience'] = "Not specified"
+            # Career level, qualification and years of experience; find_elements
+            # reports a missing field as [] instead of raising
+            for key, xpath in DETAIL_LABEL_XPATHS.items():
+                elements = self.driver.find_elements(By.XPATH, xpath)
+                job_details[key] = elements[0].text.strip() if elements else "Not specified"
             
             # Required skills
-            try:
-                skills_elements = self.driver.find_elements(By.CSS_SELECTOR, ".skill-tag, [data-automation='skills'] span")
-                skills = [element.text.strip() for element in skills_elements]
-                job_details['required_skills'] = ", ".join(skills)
-            except NoSuchElementException:
-                job_details['required_skills'] = "Not specified"
+            skills_elements = self.driver.find_elements(By.CSS_SELECTOR, DETAIL_SKILLS_SELECTOR)
+            job_details['required_skills'] = ", ".join(element.text.strip() for element in skills_elements)
             
             # Close the tab and switch back
             self.driver.close()
@@ -349,119 +703,436 @@ class JobStreetScraper:
                 
             return {'full_description': "Failed to retrieve full description"}
     
+    def _rows_to_jobs(self, rows, query):
+        """Turn raw job card rows into job dicts tagged with the search query."""
+        page_jobs = []
+        for row in rows:
+            job_data = self._extract_job_data(row)
+            
+            if job_data:
+                job_data['search_query'] = query
+                page_jobs.append(job_data)
+        
+        # The same job can appear twice on one page, e.g. as a featured card
+        return _unique_jobs(page_jobs)
+    
+    def _scrape_page_over_http(self, url):
+        """
+        Fetch a search results page without the browser and read its job cards.
+        
+        Returns:
+            list: Raw job card rows, empty if the request failed or no cards were found
+        """
+        try:
+            resp = self.http.get(url, timeout=20)
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            print(f"Error fetching {url}: {e}")
+            return []
+        
+        # selectolax's lexbor parser is the hot path here: one parse, many CSS queries per card
+        tree = LexborHTMLParser(resp.text)
+        return [_extract_card_fields(card, resp.url) for card in _job_cards(tree)]
+    
+    def _scrape_page_with_browser(self, url, page):
+        """
+        Load a search results page in the browser and read its job cards.
+        
+        Returns:
+            list: Raw job card rows, or None if the page had no job cards
+        """
+        self._start_driver()
+        
+        # Load the page
+        self.driver.get(url)
+        
+        # Accept cookies if the dialog appears
+        self._accept_cookies_if_present()
+        
+        # Close any popups
+        self._close_popups()
+        
+        # Scroll to load all content
+        self._human_like_scroll(wait_selector="[data-automation='paginationBottom']")
+        
+        # Wait for job cards to load
+        try:
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, JOB_CARD_SELECTOR))
+            )
+        except TimeoutException:
+            print(f"No job cards found on page {page} or page took too long to load")
+            return []
+        
+        # Read every job card's fields in one browser call
+        rows = self.driver.execute_script(JS_EXTRACT, JOB_CARD_SELECTOR, CARD_FIELD_SELECTORS)
+        
+        if not rows:
+            print(f"No job cards found on page {page}")
+            return None
+        
+        return rows
+    
+    def _scrape_page(self, query, page):
+        """
+        Scrape one search results page.
+        
+        The server-rendered HTML is fetched over the keep-alive HTTP session
+        first. The browser is only used when that yields no job cards, which
+        usually means a bot challenge was served.
+        
+        Returns:
+            list: Job dicts found on the page, or None if the page had no job cards
+        """
+        url = self._build_search_url(query, page)
+        print(f"Scraping page {page}/{self.num_pages}: {url}")
+        
+        rows = self._scrape_page_over_http(url)
+        if not rows:
+            rows = self._scrape_page_with_browser(url, page)
+            if rows is None:
+                return None
+        
+        print(f"Found {len(rows)} job cards on page {page}")
+        page_jobs = self._rows_to_jobs(rows, query)
+        
+        # Detail pages are independent requests, so fetch the whole page's worth at once
+        if self.scrape_details:
+            self._add_job_details(page_jobs)
+        
+        return page_jobs
+    
+    def _scrape_query(self, query):
+        """
+        Scrape every result page for a single query.
+        
+        Pages are yielded as they are scraped so the caller decides where the
+        rows go, and no more than one page is held here at a time.
+        
+        Args:
+            query (str): Job query string to search for
+            
+        Yields:
+            list: Job dicts scraped from one page
+        """
+        print(f"Searching for: {query} in {self.location}")
+        
+        for page in range(1, self.num_pages + 1):  # JobStreet uses 1-based page indexing
+            try:
+                page_jobs = self._scrape_page(query, page)
+                
+                if page_jobs is None:
+                    break
+                
+                yield page_jobs
+                
+                # Random delay before the next page
+                self._human_like_delay(5, 10)
+                
+            except Exception as e:
+                print(f"Error scraping page {page}: {e}")
+                continue
+    
     def scrape_jobs(self, job_queries=None):
         """
         Scrape jobs from JobStreet based on queries.
         
         Args:
             job_queries (list): List of job query strings to search for
+            
+        Returns:
+            list: The scraped jobs, or an empty list when streaming to output_file
         """
         if job_queries is None:
             job_queries = ["data scientist", "data analyst", "project manager", "business analyst"]
         
-        total_jobs_scraped = 0
-        
         try:
-            for query in job_queries:
-                print(f"Searching for: {query} in {self.location}")
-                
-                for page in range(1, self.num_pages + 1):  # JobStreet uses 1-based page indexing
-                    url = self._build_search_url(query, page)
-                    print(f"Scraping page {page}/{self.num_pages}: {url}")
-                    
-                    try:
-                        # Load the page
-                        self.driver.get(url)
-                        self._human_like_delay(3, 6)
-                        
-                        # Accept cookies if the dialog appears
-                        self._accept_cookies_if_present()
-                        
-                        # Close any popups
-                        self._close_popups()
-                        
-                        # Scroll to load all content
-                        self._human_like_scroll()
-                        
-                        # Wait for job cards to load
-                        try:
-                            WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, "article, [data-automation='jobListing'], .sx2jih0"))
-                            )
-                        except TimeoutException:
-                            print(f"No job cards found on page {page} or page took too long to load")
-                            continue
-                        
-                        # Find all job cards
-                        job_cards = self.driver.find_elements(By.CSS_SELECTOR, "article, [data-automation='jobListing'], .sx2jih0")
-                        
-                        if not job_cards:
-                            print(f"No job cards found on page {page}")
-                            break
-                        
-                        print(f"Found {len(job_cards)} job cards on page {page}")
-                        
-                        # Process each job card
-                        for job_card in job_cards:
-                            job_data = self._extract_job_data(job_card)
-                            
-                            if job_data:
-                                job_data['search_query'] = query
-                                
-                                # Option to get detailed job description (uncomment if needed)
-                                # if job_data['job_url'] != "N/A" and random.random() < 0.3:  # Only get details for ~30% of jobs
-                                #     details = self.scrape_job_details(job_data['job_url'])
-                                #     job_data.update(details)
-                                
-                                self.jobs.append(job_data)
-                                total_jobs_scraped += 1
-                                
-                                # Print progress
-                                if total_jobs_scraped % 10 == 0:
-                                    print(f"Scraped {total_jobs_scraped} jobs so far")
-                        
-                        # Random delay before the next page
-                        self._human_like_delay(5, 10)
-                        
-                    except Exception as e:
-                        print(f"Error scraping page {page}: {e}")
-                        continue
-                
-                # Extra delay between different queries
-                self._human_like_delay(8, 15)
-                
-                # Switch user agent occasionally
-                if random.random() < 0.5:
-                    self.driver.execute_cdp_cmd("Network.setUserAgentOverride", {
-                        "userAgent": random.choice(self.user_agents)
-                    })
+            with self._detail_fetcher():
+                self._scrape_queries(job_queries)
         
         finally:
             # Always close the driver when done
-            self.driver.quit()
+            self._quit_driver()
         
-        print(f"Total jobs scraped: {total_jobs_scraped}")
+        print(f"Total jobs scraped: {self.jobs_scraped}")
         return self.jobs
     
-    def save_to_csv(self, filename="jobstreet_malaysia_jobs.csv"):
-        """Save scraped job data to a CSV file."""
+    def _scrape_queries(self, job_queries):
+        """Scrape and record every query in turn."""
+        for query in job_queries:
+            for page_jobs in self._scrape_query(query):
+                for job_data in page_jobs:
+                    self._record_job(job_data)
+                self._flush_csv()
+            
+            # Extra delay between different queries
+            self._human_like_delay(8, 15)
+            
+            # Switch user agent occasionally
+            if self._rng.random() < 0.5:
+                user_agent = next(self._ua_cycle)
+                self.http.headers["User-Agent"] = user_agent
+                if self.driver is not None:
+                    self.driver.execute_cdp_cmd("Network.setUserAgentOverride", {
+                        "userAgent": user_agent
+                    })
+    
+    def save_to_csv(self, filename="jobstreet_malaysia_jobs.csv", use_pyarrow=True):
+        """
+        Save scraped job data to a CSV file.
+        
+        When streaming to output_file the rows are already on disk, so this
+        only flushes the file and returns its name.
+        
+        Args:
+            filename (str): Output file name; a timestamp is added before the extension
+            use_pyarrow (bool): Write with pyarrow's CSV writer instead of building a pandas DataFrame
+        """
+        if self._csv_fh is not None:
+            self._flush_csv()
+            print(f"Successfully saved {self.jobs_scraped} jobs to {self.output_file}")
+            return self.output_file
+        
         if not self.jobs:
             print("No jobs to save.")
             return
         
         try:
             # Add timestamp to filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename_with_timestamp = f"{os.path.splitext(filename)[0]}_{timestamp}{os.path.splitext(filename)[1]}"
+            filename_with_timestamp = _timestamped_filename(filename)
             
-            df = pd.DataFrame(self.jobs)
-            df.to_csv(filename_with_timestamp, index=False, quoting=csv.QUOTE_ALL, encoding='utf-8')
+            if use_pyarrow:
+                # Imported here so pyarrow is only needed when it is actually used
+                import pyarrow as pa
+                import pyarrow.compute as pc
+                import pyarrow.csv as pacsv
+                
+                # from_pylist infers columns from the first row only, so list them up front
+                present = dict.fromkeys(key for job in self.jobs for key in job)
+                columns = [field for field in FIELDS + DETAIL_FIELDS if field in present]
+                columns += [key for key in present if key not in columns]
+                schema = pa.schema([(column, pa.string()) for column in columns])
+                
+                # Every column is written as text, so stringify values the way pandas' writer would
+                rows = [{key: None if value is None else str(value) for key, value in job.items()} for job in self.jobs]
+                table = pa.Table.from_pylist(rows, schema=schema)
+                # Write missing values as "" like the pandas path, not as unquoted nulls
+                table = pa.table([pc.fill_null(column, "") for column in table.columns], schema=schema)
+                pacsv.write_csv(table, filename_with_timestamp,
+                                write_options=pacsv.WriteOptions(quoting_style="all_valid"))
+            else:
+                df = pd.DataFrame(self.jobs)
+                df.to_csv(filename_with_timestamp, index=False, quoting=csv.QUOTE_ALL, encoding='utf-8')
             print(f"Successfully saved {len(self.jobs)} jobs to {filename_with_timestamp}")
             return filename_with_timestamp
         except Exception as e:
             print(f"Error saving to CSV: {e}")
             return None
 
+class AsyncJobStreetScraper(JobStreetScraper):
+    """
+    Browserless JobStreet scraper.
+    
+    JobStreet embeds the search results as JSON in the listing page's
+    __NEXT_DATA__ script, so the raw HTML is fetched over a shared HTTP/2
+    connection pool and parsed once. Selenium is only started for pages
+    where that blob is missing.
+    """
+    
+    def __init__(self, location="Malaysia", num_pages=5, headless=True, max_concurrency=8, output_file=None,
+                 scrape_details=False):
+        """
+        Initialize the async JobStreet Malaysia scraper.
+        
+        Args:
+            location (str): The location to search for jobs (default: Malaysia)
+            num_pages (int): Number of pages to scrape per query
+            headless (bool): Whether to run the fallback Chrome in headless mode
+            max_concurrency (int): Maximum number of listing pages fetched at once
+            output_file (str): CSV file to stream jobs to, see JobStreetScraper
+            scrape_details (bool): Whether to also fetch each job's detail page
+        """
+        super().__init__(location=location, num_pages=num_pages, headless=headless, output_file=output_file,
+                         scrape_details=scrape_details)
+        self.max_concurrency = max_concurrency
+    
+    def _job_from_next_data(self, job, query):
+        """
+        Map a job entry from __NEXT_DATA__ to the same dict as _extract_job_data.
+        
+        Returns None for jobs already recorded under another query or page.
+        """
+        def text_or_na(value):
+            return str(value).strip() if value else "N/A"
+        
+        if job.get('id') and str(job['id']) in self._seen_ids:
+            return None
+        
+        job_id = str(job.get('id') or f"{FALLBACK_ID_PREFIX}{self._rng.randint(10000, 99999)}")
+        job_title = text_or_na(job.get('title'))
+        description = text_or_na(job.get('teaser'))
+        
+        company = job.get('companyName') or (job.get('advertiser') or {}).get('description')
+        
+        location = job.get('location')
+        if not location and job.get('locations'):
+            location = job['locations'][0].get('label')
+        
+        job_type = job.get('workType') or ", ".join(job.get('workTypes') or [])
+        
+        industry = None
+        if job.get('classifications'):
+            industry = (job['classifications'][0].get('classification') or {}).get('description')
+        if not industry:
+            industry = _infer_industry(job_title, description)
+        
+        skills = _match_skills(description)
+        
+        return {
+            'job_id': job_id,
+            'job_title': job_title,
+            'company': text_or_na(company),
+            'location': text_or_na(location),
+            'description': description,
+            'salary': text_or_na(job.get('salaryLabel') or job.get('salary')),
+            'job_type': text_or_na(job_type),
+            'posting_date': text_or_na(job.get('listingDateDisplay')),
+            'job_url': f"{self.base_url}/job/{job_id}" if job.get('id') else "N/A",
+            'industry': industry,
+            'skills': ", ".join(skills) if skills else "Not specified",
+            'scraped_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'search_query': query
+        }
+    
+    async def _fetch_page(self, client, semaphore, query, page):
+        """
+        Fetch one listing page and parse the jobs out of __NEXT_DATA__.
+        
+        Returns:
+            list: Job dicts found on the page, or None if __NEXT_DATA__ is missing
+        """
+        url = self._build_search_url(query, page)
+        
+        async with semaphore:
+            print(f"Fetching page {page}/{self.num_pages}: {url}")
+            try:
+                resp = await client.get(url)
+                resp.raise_for_status()
+            except httpx.HTTPError as e:
+                print(f"Error fetching page {page} for {query}: {e}")
+                return None
+        
+        script = LexborHTMLParser(resp.text).css_first("script#__NEXT_DATA__")
+        if script is None:
+            return None
+        
+        try:
+            data = json.loads(script.text())
+            jobs = data['props']['pageProps']['results']['results']['jobs']
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Unexpected __NEXT_DATA__ layout on page {page} for {query}: {e}")
+            return None
+        
+        page_jobs = [self._job_from_next_data(job, query) for job in jobs]
+        return [job_data for job_data in page_jobs if job_data]
+    
+    async def scrape_jobs_async(self, job_queries=None):
+        """
+        Fetch every (query, page) combination concurrently.
+        
+        Args:
+            job_queries (list): List of job query strings to search for
+        """
+        if job_queries is None:
+            job_queries = ["data scientist", "data analyst", "project manager", "business analyst"]
+        
+        tasks = [(query, page) for query in job_queries for page in range(1, self.num_pages + 1)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async with httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": next(self._ua_cycle)},
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            timeout=20,
+            follow_redirects=True
+        ) as client:
+            results = await asyncio.gather(*[
+                self._fetch_page(client, semaphore, query, page) for query, page in tasks
+            ])
+        
+        fallback_pages = []
+        jobs = []
+        for (query, page), page_jobs in zip(tasks, results):
+            if page_jobs is None:
+                fallback_pages.append((query, page))
+            else:
+                jobs.extend(page_jobs)
+        
+        # Pages fetched concurrently haven't been recorded yet, so overlapping queries repeat jobs here
+        jobs = _unique_jobs(jobs)
+        
+        # Every listing page is already in memory, so fetch all detail pages in one pass
+        if self.scrape_details:
+            self._detail_session = await self._open_detail_session()
+            try:
+                await self._add_job_details_async(jobs)
+            finally:
+                await self._detail_session.close()
+                self._detail_session = None
+        
+        for job_data in jobs:
+            self._record_job(job_data)
+        
+        if fallback_pages:
+            # The card path is blocking and runs its own event loop for details
+            await asyncio.to_thread(self._scrape_card_pages, fallback_pages)
+        
+        print(f"Total jobs scraped: {self.jobs_scraped}")
+        return self.jobs
+    
+    def _scrape_card_pages(self, pages):
+        """Scrape pages without __NEXT_DATA__ through the regular card-based path."""
+        print(f"Falling back to card scraping for {len(pages)} page(s)")
+        try:
+            with self._detail_fetcher():
+                for query, page in pages:
+                    try:
+                        page_jobs = self._scrape_page(query, page)
+                        for job_data in page_jobs or []:
+                            self._record_job(job_data)
+                        self._human_like_delay(5, 10)
+                    except Exception as e:
+                        print(f"Error scraping page {page}: {e}")
+        finally:
+            self._quit_driver()
+    
+    def scrape_jobs(self, job_queries=None):
+        """
+        Scrape jobs from JobStreet based on queries.
+        
+        Args:
+            job_queries (list): List of job query strings to search for
+        """
+        return asyncio.run(self.scrape_jobs_async(job_queries))
+
+def _scrape_one_query(query, location, num_pages, headless, scrape_details=False):
+    """
+    Scrape a single query with its own scraper. Used as a multiprocessing worker
+    because WebDriver instances cannot be shared between processes.
+    """
+    scraper = JobStreetScraper(location=location, num_pages=num_pages, headless=headless,
+                               scrape_details=scrape_details)
+    query_jobs = []
+    try:
+        with scraper._detail_fetcher():
+            # Rows are only collected here; the parent process records and reports them.
+            # Marking them seen lets later pages of this query skip repeats early.
+            for page_jobs in scraper._scrape_query(query):
+                query_jobs.extend(job_data for job_data in page_jobs if scraper._is_new_job(job_data['job_id']))
+        return query_jobs
+    finally:
+        scraper._quit_driver()
+
 def main():
     # Job search queries to use (add or remove as needed)
     job_queries = [
@@ -473,18 +1144,49 @@ def main():
         "data engineer"
     ]
     
-    # Initialize the scraper
-    scraper = JobStreetScraper(
-        location="Malaysia",
-        num_pages=5,  # Adjust based on your needs
-        headless=False  # Set to True for headless mode
-    )
+    location = "Malaysia"
+    num_pages = 5  # Adjust based on your needs
+    headless = True  # Each worker runs its own Chrome, so keep them headless
+    scrape_details = False  # Set to True to also fetch each job's full description
+    use_async = False  # Set to True to read listings from __NEXT_DATA__ without a browser
+    
+    if use_async:
+        # One process fetches every listing page concurrently; Chrome only starts for pages
+        # that don't embed __NEXT_DATA__
+        scraper = AsyncJobStreetScraper(location=location, num_pages=num_pages, headless=headless,
+                                        output_file="jobstreet_malaysia_jobs2.csv",
+                                        scrape_details=scrape_details)
+        scraper.scrape_jobs(job_queries)
+        scraper.save_to_csv()
+        return
+    
+    # The parent process streams every worker's results to a single CSV
+    writer = JobStreetScraper(location=location, num_pages=num_pages, headless=headless,
+                              output_file="jobstreet_malaysia_jobs2.csv", scrape_details=scrape_details)
+    
+    # Resolve ChromeDriver once here so workers that need Chrome skip webdriver_manager.
+    # Most pages never need the browser, so a failure here must not stop the run.
+    chromedriver_path = None
+    if not os.environ.get("CHROMEDRIVER_PATH"):
+        try:
+            chromedriver_path = _get_chromedriver_path()
+        except Exception as e:
+            print(f"Could not resolve ChromeDriver, workers will retry if they need Chrome: {e}")
     
-    # Scrape jobs
-    jobs = scraper.scrape_jobs(job_queries)
+    # Scrape each query in its own process; maxtasksperchild=1 recycles Chrome per query
+    processes = min(len(job_queries), os.cpu_count() or 1)
+    worker = partial(_scrape_one_query, location=location, num_pages=num_pages, headless=headless,
+                     scrape_details=scrape_details)
+    with multiprocessing.Pool(processes=processes, maxtasksperchild=1,
+                              initializer=_init_worker, initargs=(chromedriver_path,)) as pool:
+        for query_jobs in pool.imap_unordered(worker, job_queries):
+            for job_data in query_jobs:
+                # Workers dedupe within a query; _record_job dedupes across queries
+                writer._record_job(job_data)
+            writer._flush_csv()
     
-    # Save to CSV
-    scraper.save_to_csv("jobstreet_malaysia_jobs2.csv")
+    print(f"Total jobs scraped: {writer.jobs_scraped}")
+    writer.save_to_csv()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The scraper and metrics live as plain modules under src/, not an installed package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "src", "framework"))
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+import selenium_jobstreet_scraper as scraper
+
+
+NEXT_DATA_JOB = {
+    'id': 81234567,
+    'title': " Data Scientist ",
+    'teaser': "Build models in Python and SQL",
+    'advertiser': {'description': "Acme"},
+    'locations': [{'label': "Kuala Lumpur"}],
+    'workTypes': ["Full time"],
+    'salaryLabel': "RM 5,000",
+    'listingDateDisplay': "2d ago",
+    'classifications': [{'classification': {'description': "Information & Communication Technology"}}],
+}
+
+
+def _listing_page(jobs):
+    data = {'props': {'pageProps': {'results': {'results': {'jobs': jobs}}}}}
+    return f'<html><body><script id="__NEXT_DATA__" type="application/json">{json.dumps(data)}</script></body></html>'
+
+
+def test_job_from_next_data_maps_fields():
+    job_scraper = scraper.AsyncJobStreetScraper()
+    job = job_scraper._job_from_next_data(NEXT_DATA_JOB, "data scientist")
+
+    assert job['job_id'] == "81234567"
+    assert job['job_title'] == "Data Scientist"
+    assert job['company'] == "Acme"
+    assert job['location'] == "Kuala Lumpur"
+    assert job['job_type'] == "Full time"
+    assert job['salary'] == "RM 5,000"
+    assert job['posting_date'] == "2d ago"
+    assert job['job_url'] == f"{job_scraper.base_url}/job/81234567"
+    assert job['industry'] == "Information & Communication Technology"
+    assert job['skills'] == "python, sql"
+    assert job['search_query'] == "data scientist"
+
+
+def test_job_from_next_data_skips_recorded_ids_and_falls_back():
+    job_scraper = scraper.AsyncJobStreetScraper()
+    job_scraper._record_job(job_scraper._job_from_next_data(NEXT_DATA_JOB, "data scientist"))
+
+    assert job_scraper._job_from_next_data(NEXT_DATA_JOB, "data analyst") is None
+
+    job = job_scraper._job_from_next_data({'title': "Analyst"}, "data analyst")
+    assert job['job_url'] == "N/A"
+    assert job['company'] == "N/A"
+    assert job['industry'] == "Not specified"
+
+
+def test_fetch_page_reads_next_data():
+    def handler(request):
+        if request.url.params.get('page') == "2":
+            return httpx.Response(200, text="<html><body>No data here</body></html>")
+        return httpx.Response(200, text=_listing_page([NEXT_DATA_JOB, {'id': 2, 'title': "Analyst"}]))
+
+    async def fetch(page):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await job_scraper._fetch_page(client, asyncio.Semaphore(1), "data scientist", page)
+
+    job_scraper = scraper.AsyncJobStreetScraper()
+
+    jobs = asyncio.run(fetch(1))
+    assert [job['job_id'] for job in jobs] == ["81234567", "2"]
+    assert jobs[1]['job_title'] == "Analyst"
+
+    assert asyncio.run(fetch(2)) is None
+
+
+@pytest.fixture
+def job_site():
+    """Serve a listing page whose every result is job 5, and count requests per path."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append((self.path.split("?")[0], self.headers["User-Agent"]))
+            if self.path.startswith("/jobs"):
+                body = _listing_page([{'id': 5, 'title': "Analyst"}])
+            else:
+                body = '<div data-automation="jobDetailsDescription">Details</div>'
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", hits
+    server.shutdown()
+    server.server_close()
+
+
+def test_rows_to_jobs_drops_repeated_ids_on_a_page():
+    job_scraper = scraper.JobStreetScraper()
+    rows = [
+        {'job_title': "Analyst", 'job_url': "https://www.jobstreet.com.my/job/5?type=standout"},
+        {'job_title': "Analyst", 'job_url': "https://www.jobstreet.com.my/job/5"},
+        {'job_title': "No link"},
+        {'job_title': "No link"},
+    ]
+    jobs = job_scraper._rows_to_jobs(rows, "data analyst")
+
+    assert [job['job_title'] for job in jobs] == ["Analyst", "No link", "No link"]
+    assert jobs[0]['job_id'] == "5"
+
+
+def test_async_scrape_fetches_each_detail_page_once(job_site):
+    base_url, hits = job_site
+    job_scraper = scraper.AsyncJobStreetScraper(num_pages=2, scrape_details=True)
+    job_scraper.base_url = base_url
+
+    jobs = job_scraper.scrape_jobs(["data analyst", "business analyst"])
+
+    assert [job['job_id'] for job in jobs] == ["5"]
+    assert jobs[0]['full_description'] == "Details"
+    assert [path for path, _ in hits].count("/job/5") == 1
+
+
+def test_detail_requests_use_the_current_user_agent(job_site):
+    base_url, hits = job_site
+    job_scraper = scraper.JobStreetScraper(scrape_details=True)
+    jobs = [{'job_id': "5", 'job_url': f"{base_url}/job/5"}]
+
+    with job_scraper._detail_fetcher():
+        job_scraper.http.headers["User-Agent"] = "rotated-agent"
+        job_scraper._add_job_details(jobs)
+
+    assert hits == [("/job/5", "rotated-agent")]
+    assert jobs[0]['full_description'] == "Details"
@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+import selenium_jobstreet_scraper as scraper
+
+
+@pytest.mark.skipif(not (sys.platform.startswith("linux") and os.path.isdir("/dev/shm")),
+                    reason="the profile only goes to /dev/shm on Linux")
+def test_failed_chrome_start_removes_profile_dir(monkeypatch):
+    created = []
+    real_mkdtemp = scraper.tempfile.mkdtemp
+
+    def mkdtemp(**kwargs):
+        created.append(real_mkdtemp(**kwargs))
+        return created[-1]
+
+    def chrome(**kwargs):
+        raise WebDriverException("Chrome failed to start")
+
+    monkeypatch.setattr(scraper.tempfile, "mkdtemp", mkdtemp)
+    monkeypatch.setattr(scraper, "_get_chromedriver_path", lambda: "/usr/bin/chromedriver")
+    monkeypatch.setattr(scraper.webdriver, "Chrome", chrome)
+    job_scraper = scraper.JobStreetScraper(headless=True)
+
+    with pytest.raises(WebDriverException):
+        job_scraper._start_driver()
+
+    assert len(created) == 1
+    assert not os.path.exists(created[0])
+    assert job_scraper._profile_dir is None
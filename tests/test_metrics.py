@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from metrics import (
+    MetricsAggregator,
+    calculate_application_rate,
+    calculate_application_rate_batch,
+    calculate_ctr,
+    calculate_ctr_batch,
+    calculate_time_spent,
+)
+
+
+def test_scalar_metrics_handle_zero_denominators():
+    assert calculate_ctr(0, 5) == 0
+    assert calculate_application_rate(0, 5) == 0
+    assert calculate_ctr(4, 1) == 0.25
+    assert calculate_application_rate(4, 2) == 0.5
+
+
+def test_time_spent_empty_and_values():
+    assert calculate_time_spent([]) == 0.0
+    assert calculate_time_spent(np.array([])) == 0.0
+    assert calculate_time_spent([10, 20, 30]) == 20.0
+
+
+def test_ctr_batch_matches_scalar_and_zero_impressions():
+    impressions = [0, 10, 4, 0]
+    clicks = [3, 5, 1, 0]
+    result = calculate_ctr_batch(impressions, clicks)
+    expected = [calculate_ctr(i, c) for i, c in zip(impressions, clicks)]
+    np.testing.assert_allclose(result, expected)
+
+
+def test_application_rate_batch_matches_scalar_and_zero_clicks():
+    clicks = [0, 10, 3]
+    applications = [2, 5, 1]
+    result = calculate_application_rate_batch(clicks, applications)
+    expected = [calculate_application_rate(c, a) for c, a in zip(clicks, applications)]
+    np.testing.assert_allclose(result, expected)
+
+
+def test_batch_metrics_on_empty_input():
+    assert calculate_ctr_batch([], []).size == 0
+    assert calculate_application_rate_batch([], []).size == 0
+
+
+def test_aggregator_empty_finalize():
+    assert MetricsAggregator().finalize() == {"ctr": 0, "app_rate": 0, "avg_time": 0.0}
+
+
+def test_aggregator_scalar_and_batch_agree():
+    impressions = [10, 0, 5.5]
+    clicks = [2, 0, 1.5]
+    applications = [1, 0, 0.5]
+    durations = [30.0, 12.5, 7.25]
+
+    scalar = MetricsAggregator()
+    for row in zip(impressions, clicks, applications, durations):
+        scalar.update(*row)
+
+    batch = MetricsAggregator()
+    batch.update_batch(np.array(impressions), np.array(clicks), np.array(applications), np.array(durations))
+
+    assert batch.finalize() == pytest.approx(scalar.finalize())
+    assert scalar.finalize() == pytest.approx({
+        "ctr": calculate_ctr(sum(impressions), sum(clicks)),
+        "app_rate": calculate_application_rate(sum(clicks), sum(applications)),
+        "avg_time": calculate_time_spent(durations),
+    })
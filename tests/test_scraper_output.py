@@ -0,0 +1,98 @@
+import csv
+
+import selenium_jobstreet_scraper as scraper
+
+
+CARD_ROW = {
+    'job_title': "Data Scientist",
+    'company': "Acme",
+    'location': "Kuala Lumpur",
+    'description': "Python and SQL",
+    'salary': None,
+    'job_type': "Full time",
+    'posting_date': "2d ago",
+    'industry': None,
+    'job_url': "https://www.jobstreet.com.my/job/123?type=standard",
+}
+
+
+def _read_csv(filename):
+    with open(filename, newline="", encoding="utf-8") as fh:
+        return list(csv.reader(fh))
+
+
+def test_streamed_csv_writes_header_and_detail_rows(tmp_path, monkeypatch):
+    job_scraper = scraper.JobStreetScraper(num_pages=2, output_file=str(tmp_path / "jobs.csv"), scrape_details=True)
+
+    def add_details(jobs):
+        for job in jobs:
+            job.update(full_description="Build models", required_skills="Python")
+
+    monkeypatch.setattr(job_scraper, "_human_like_delay", lambda *args: None)
+    monkeypatch.setattr(job_scraper, "_scrape_page_over_http", lambda url: [CARD_ROW] if url.endswith("page=1") else [])
+    monkeypatch.setattr(job_scraper, "_scrape_page_with_browser", lambda url, page: None)
+    monkeypatch.setattr(job_scraper, "_add_job_details", add_details)
+
+    assert job_scraper.scrape_jobs(["data scientist"]) == []
+    filename = job_scraper.save_to_csv()
+
+    assert filename == job_scraper.output_file
+    header, *rows = _read_csv(filename)
+    assert header == scraper.FIELDS + scraper.DETAIL_FIELDS
+    assert len(rows) == 1
+    row = dict(zip(header, rows[0]))
+    assert row['job_id'] == "123"
+    assert row['salary'] == "N/A"
+    assert row['search_query'] == "data scientist"
+    assert row['full_description'] == "Build models"
+    assert row['required_skills'] == "Python"
+    assert row['qualification'] == ""
+
+
+def test_streamed_csv_without_details_has_base_columns(tmp_path):
+    job_scraper = scraper.JobStreetScraper(output_file=str(tmp_path / "jobs.csv"))
+    job_scraper._record_job({'job_id': "1", 'job_title': "Analyst", 'full_description': "ignored"})
+    filename = job_scraper.save_to_csv()
+
+    header, row = _read_csv(filename)
+    assert header == scraper.FIELDS
+    assert row[:2] == ["1", "Analyst"]
+    assert len(row) == len(scraper.FIELDS)
+
+
+def test_record_job_dedupes_real_ids_only():
+    job_scraper = scraper.JobStreetScraper()
+    for job_id in ["123", "123", "job_11111", "job_11111"]:
+        job_scraper._record_job({'job_id': job_id})
+
+    assert [job['job_id'] for job in job_scraper.jobs] == ["123", "job_11111", "job_11111"]
+
+
+def test_save_to_csv_pyarrow_keeps_detail_columns(tmp_path):
+    job_scraper = scraper.JobStreetScraper()
+    job_scraper.jobs = [
+        {'job_id': "1", 'job_url': "N/A"},
+        {'job_id': "2", 'job_url': "u", 'full_description': "d", 'experience_level': "Senior"},
+    ]
+
+    arrow_file = job_scraper.save_to_csv(str(tmp_path / "arrow.csv"))
+    pandas_file = job_scraper.save_to_csv(str(tmp_path / "pandas.csv"), use_pyarrow=False)
+
+    with open(arrow_file, newline="", encoding="utf-8") as fh:
+        arrow_rows = list(csv.reader(fh))
+    with open(pandas_file, newline="", encoding="utf-8") as fh:
+        pandas_rows = list(csv.reader(fh))
+
+    assert arrow_rows[0] == ['job_id', 'job_url', 'full_description', 'experience_level']
+    assert arrow_rows == pandas_rows
+
+
+def test_save_to_csv_pyarrow_stringifies_values(tmp_path):
+    job_scraper = scraper.JobStreetScraper()
+    job_scraper.jobs = [{'job_id': 1, 'job_title': "Analyst", 'salary': None}, {'job_id': 2, 'job_title': True}]
+
+    arrow_file = job_scraper.save_to_csv(str(tmp_path / "arrow.csv"))
+    pandas_file = job_scraper.save_to_csv(str(tmp_path / "pandas.csv"), use_pyarrow=False)
+
+    assert _read_csv(arrow_file) == [['job_id', 'job_title', 'salary'], ["1", "Analyst", ""], ["2", "True", ""]]
+    assert _read_csv(arrow_file) == _read_csv(pandas_file)
@@ -0,0 +1,77 @@
+import types
+
+from selectolax.lexbor import LexborHTMLParser
+
+import selenium_jobstreet_scraper as scraper
+
+
+def test_infer_industry_ignores_pronoun_it_and_keeps_priority():
+    assert scraper._infer_industry("Accountant", "It is an exciting finance role") == "Finance"
+    assert scraper._infer_industry("IT Sales Executive", "") == "IT"
+    assert scraper._infer_industry("Sales Engineer", "") == "Sales"
+    assert scraper._infer_industry("Barista", "Work with coffee") == "Not specified"
+
+
+def test_match_skills_whole_words_in_list_order():
+    description = "SQL, Python and project management; JavaScript is a plus"
+    assert scraper._match_skills(description) == ["python", "sql", "project management"]
+    assert scraper._match_skills("") == []
+
+
+def test_extract_card_fields():
+    html = """
+    <article data-automation="jobListing">
+      <h1 class="job-title"> Data <b>Scientist</b> </h1>
+      <a href="/job/123?type=standard">View</a>
+      <span data-automation="jobCompany">Acme</span>
+      <span data-automation="jobSalary">RM 5,000</span>
+    </article>
+    """
+    cards = scraper._job_cards(LexborHTMLParser(html))
+    assert len(cards) == 1
+    row = scraper._extract_card_fields(cards[0], "https://my.jobstreet.com/jobs?q=data")
+
+    assert row["job_title"] == "Data Scientist"
+    assert row["company"] == "Acme"
+    assert row["salary"] == "RM 5,000"
+    assert row["location"] is None
+    assert row["job_url"] == "https://my.jobstreet.com/job/123?type=standard"
+
+
+def test_job_cards_keeps_document_order():
+    html = """
+    <div class="sx2jih0" id="a"></div>
+    <article data-automation="jobListing" id="b"></article>
+    <div data-automation="jobListing" id="c"></div>
+    """
+    cards = scraper._job_cards(LexborHTMLParser(html))
+
+    assert [card.attributes["id"] for card in cards] == ["a", "b", "c"]
+
+
+def test_parse_job_details():
+    html = """
+    <html><body>
+      <div data-automation="jobDetailsDescription"> Build models </div>
+      <div><label>Career Level</label><span>Senior</span></div>
+      <span class="skill-tag">Python</span><span class="skill-tag">SQL</span>
+    </body></html>
+    """
+    details = scraper._parse_job_details(html)
+
+    assert details == {
+        'full_description': "Build models",
+        'experience_level': "Senior",
+        'qualification': "Not specified",
+        'years_of_experience': "Not specified",
+        'required_skills': "Python, SQL",
+    }
+
+
+def test_scrape_job_details_returns_failure_dict_on_unparsable_page(monkeypatch):
+    job_scraper = scraper.JobStreetScraper()
+    monkeypatch.setattr(job_scraper.http, "get", lambda *args, **kwargs: types.SimpleNamespace(status_code=200, text=""))
+
+    assert job_scraper.scrape_job_details("https://my.jobstreet.com/job/1") == {
+        'full_description': "Failed to retrieve full description"
+    }